@@ -5,17 +5,19 @@ Provides API endpoints for:
   - User authentication (login/register via Supabase)
   - SQL AI analysis (upload data, ask questions)
   - PDF AI analysis (upload PDF, ask questions, summarize)
+  - Server-Sent Events (SSE) streaming variants of the query endpoints
 """
 
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, StreamingResponse
 from pydantic import BaseModel
 import pandas as pd
 import json
 import uuid
 import io
+import time
 
 import gemini
 
@@ -41,6 +43,56 @@ SQL_SESSIONS: dict[str, dict] = {}
 PDF_SESSIONS: dict[str, dict] = {}
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+#  SSE  HELPERS
+# ══════════════════════════════════════════════════════════════════════════════
+# Streaming endpoints emit these events, in order (/unified/query/stream
+# first sends a `route` event with the chosen query type):
+#   sql    — generated SQL + result rows, as soon as execution finishes
+#   token  — a chunk of summary / answer text, as the model produces it
+#   done   — timing (ms) and retrieval metadata
+#   error  — sent instead of the remaining events if something fails mid-stream
+
+def _sse(event: str, data: dict) -> str:
+    """Format one Server-Sent Event frame."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def _elapsed_ms(start: float) -> int:
+    return int((time.perf_counter() - start) * 1000)
+
+
+def _sse_response(events) -> StreamingResponse:
+    """Wrap a (sync) event generator; Starlette iterates it in a threadpool."""
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _sql_event_payload(result: dict) -> dict:
+    return {
+        "status": result["status"],
+        "sql_query": result.get("sql_query", ""),
+        "results": result.get("results", []),
+        "columns": result.get("columns", []),
+        "row_count": result.get("row_count", 0),
+        "error": result.get("error"),
+    }
+
+
+def _stream_tokens(tokens, start: float, timing: dict, key: str, source: str = ""):
+    """Forward model tokens as SSE frames, recording time-to-first-token."""
+    for text in tokens:
+        if key not in timing:
+            timing[key] = _elapsed_ms(start)
+        payload = {"text": text}
+        if source:
+            payload["source"] = source
+        yield _sse("token", payload)
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 #  AUTH  MODELS
 # ══════════════════════════════════════════════════════════════════════════════
@@ -149,6 +201,38 @@ async def sql_query(request: SQLQueryRequest):
         raise HTTPException(status_code=500, detail=f"AI Error: {str(e)}")
 
 
+@app.post("/sql/query/stream")
+async def sql_query_stream(request: SQLQueryRequest):
+    """Streaming /sql/query: SQL + results first, then the summary over SSE."""
+    if request.session_id not in SQL_SESSIONS:
+        raise HTTPException(status_code=400, detail="No data loaded. Please upload a file first.")
+
+    session = SQL_SESSIONS[request.session_id]
+
+    def events():
+        start = time.perf_counter()
+        timing = {}
+        try:
+            result = gemini.generate_sql_from_question(
+                request.question,
+                session["schema_info"],
+                request.session_id,
+            )
+            timing["sql_ms"] = _elapsed_ms(start)
+            yield _sse("sql", _sql_event_payload(result))
+
+            yield from _stream_tokens(
+                gemini.stream_ai_summary(request.question, result),
+                start, timing, "first_token_ms",
+            )
+            timing["total_ms"] = _elapsed_ms(start)
+            yield _sse("done", {"status": result["status"], "timing": timing})
+        except Exception as e:
+            yield _sse("error", {"detail": f"AI Error: {str(e)}"})
+
+    return _sse_response(events())
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 #  PDF  AI  ENDPOINTS
 # ══════════════════════════════════════════════════════════════════════════════
@@ -227,6 +311,66 @@ async def pdf_summarize(session_id: str = Form(...)):
         raise HTTPException(status_code=500, detail=f"AI Error: {str(e)}")
 
 
+@app.post("/pdf/query/stream")
+async def pdf_query_stream(request: PDFQueryRequest):
+    """Streaming /pdf/query: answer tokens over SSE, retrieval info at the end."""
+    if request.session_id not in PDF_SESSIONS:
+        raise HTTPException(status_code=400, detail="No PDF loaded. Please upload a PDF first.")
+
+    session = PDF_SESSIONS[request.session_id]
+
+    def events():
+        start = time.perf_counter()
+        timing = {}
+        try:
+            retrieval = gemini.retrieve_pdf_context(request.question, session["pdf_text"])
+            timing["retrieval_ms"] = _elapsed_ms(start)
+
+            yield from _stream_tokens(
+                gemini.stream_pdf_answer(request.question, retrieval),
+                start, timing, "first_token_ms",
+            )
+            timing["total_ms"] = _elapsed_ms(start)
+            yield _sse("done", {
+                "status": "success",
+                "source_file": session["filename"],
+                "retrieval": {k: v for k, v in retrieval.items() if k != "context"},
+                "timing": timing,
+            })
+        except Exception as e:
+            yield _sse("error", {"detail": f"AI Error: {str(e)}"})
+
+    return _sse_response(events())
+
+
+@app.post("/pdf/summarize/stream")
+async def pdf_summarize_stream(session_id: str = Form(...)):
+    """Streaming /pdf/summarize: summary tokens over SSE."""
+    if session_id not in PDF_SESSIONS:
+        raise HTTPException(status_code=400, detail="No PDF loaded. Please upload a PDF first.")
+
+    session = PDF_SESSIONS[session_id]
+
+    def events():
+        start = time.perf_counter()
+        timing = {}
+        try:
+            yield from _stream_tokens(
+                gemini.stream_pdf_summary(session["pdf_text"]),
+                start, timing, "first_token_ms",
+            )
+            timing["total_ms"] = _elapsed_ms(start)
+            yield _sse("done", {
+                "status": "success",
+                "source_file": session["filename"],
+                "timing": timing,
+            })
+        except Exception as e:
+            yield _sse("error", {"detail": f"AI Error: {str(e)}"})
+
+    return _sse_response(events())
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 #  UNIFIED  QUERY
 # ══════════════════════════════════════════════════════════════════════════════
@@ -282,6 +426,67 @@ async def unified_query(request: UnifiedQueryRequest):
     return response
 
 
+@app.post("/unified/query/stream")
+async def unified_query_stream(request: UnifiedQueryRequest):
+    """
+    Streaming /unified/query. Emits a `route` event with the query type,
+    then the SQL part (sql + tokens) and/or the PDF part (tokens); every
+    token event carries a `source` of "sql" or "pdf".
+    """
+    has_sql = request.session_id in SQL_SESSIONS
+    has_pdf = request.session_id in PDF_SESSIONS
+
+    if not has_sql and not has_pdf:
+        raise HTTPException(
+            status_code=400,
+            detail="No data sources available. Please upload a dataset or PDF first.",
+        )
+
+    def events():
+        start = time.perf_counter()
+        timing = {}
+        done = {}
+        try:
+            try:
+                query_type = gemini.classify_query(request.question, has_sql, has_pdf)
+            except Exception:
+                query_type = "sql" if has_sql else "pdf"
+            timing["route_ms"] = _elapsed_ms(start)
+            yield _sse("route", {"query_type": query_type})
+
+            if query_type in ("sql", "both") and has_sql:
+                session = SQL_SESSIONS[request.session_id]
+                sql_result = gemini.generate_sql_from_question(
+                    request.question, session["schema_info"], request.session_id
+                )
+                timing["sql_ms"] = _elapsed_ms(start)
+                yield _sse("sql", _sql_event_payload(sql_result))
+                yield from _stream_tokens(
+                    gemini.stream_ai_summary(request.question, sql_result),
+                    start, timing, "sql_first_token_ms", source="sql",
+                )
+                done["sql"] = {"status": sql_result["status"]}
+
+            if query_type in ("pdf", "both") and has_pdf:
+                session = PDF_SESSIONS[request.session_id]
+                retrieval = gemini.retrieve_pdf_context(request.question, session["pdf_text"])
+                yield from _stream_tokens(
+                    gemini.stream_pdf_answer(request.question, retrieval),
+                    start, timing, "pdf_first_token_ms", source="pdf",
+                )
+                done["pdf"] = {
+                    "source_file": session["filename"],
+                    "retrieval": {k: v for k, v in retrieval.items() if k != "context"},
+                }
+
+            timing["total_ms"] = _elapsed_ms(start)
+            yield _sse("done", {"query_type": query_type, **done, "timing": timing})
+        except Exception as e:
+            yield _sse("error", {"detail": f"AI Error: {str(e)}"})
+
+    return _sse_response(events())
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 #  CLEANUP
 # ══════════════════════════════════════════════════════════════════════════════
@@ -58,6 +58,51 @@ def _safe_generate(prompt: str, max_retries: int = 3) -> str:
     raise Exception(f"Sarvam AI failed after {max_retries} retries. Last error: {last_error}")
 
 
+def _safe_generate_stream(prompt: str, max_retries: int = 3):
+    """
+    Streaming counterpart of _safe_generate: yields text deltas as sarvam-m
+    produces them. Retries with the same backoff, but only until the first
+    token has been yielded — a partial answer is never replayed.
+    """
+    last_error = None
+
+    for attempt in range(max_retries):
+        started = False
+        try:
+            client = _get_client()
+            response = client.chat.completions(
+                messages=[{"role": "user", "content": prompt}],
+                stream=True,
+            )
+            # Non-streaming response (older SDKs ignore stream=True)
+            if hasattr(response, "choices"):
+                content = response.choices[0].message.content
+                if content:
+                    yield content
+                return
+            for chunk in response:
+                if not chunk.choices:
+                    continue
+                text = chunk.choices[0].delta.content
+                if text:
+                    started = True
+                    yield text
+            return
+        except Exception as e:
+            if started:
+                raise Exception(f"Sarvam AI stream interrupted: {e}")
+            last_error = e
+            err_str = str(e).lower()
+            if "429" in str(e) or "quota" in err_str or "rate" in err_str or "resource" in err_str:
+                wait = 5 * (2 ** attempt)   # 5s, 10s, 20s
+                time.sleep(wait)
+                continue
+            else:
+                raise Exception(f"Sarvam AI error: {last_error}")
+
+    raise Exception(f"Sarvam AI failed after {max_retries} retries. Last error: {last_error}")
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 #  SQL AI  AGENT
 # ══════════════════════════════════════════════════════════════════════════════
@@ -192,11 +237,8 @@ SQL QUERY:"""
         }
 
 
-def generate_ai_summary(question: str, sql_result: dict) -> str:
-    """Generate a natural language summary of SQL results using Sarvam AI."""
-    if sql_result["status"] == "error":
-        return f"❌ SQL Error: {sql_result['error']}"
-
+def _build_summary_prompt(question: str, sql_result: dict) -> str:
+    """Build the analyst prompt used to summarise SQL results."""
     results_preview = json.dumps(sql_result["results"][:20], indent=2, default=str)
 
     prompt = f"""You are an expert data analyst. The user asked a question and a SQL query was executed.
@@ -218,7 +260,24 @@ Your response MUST be in markdown and MUST include:
 
 Be concise, data-driven, and avoid repeating the raw data unnecessarily."""
 
-    return _safe_generate(prompt)
+    return prompt
+
+
+def generate_ai_summary(question: str, sql_result: dict) -> str:
+    """Generate a natural language summary of SQL results using Sarvam AI."""
+    if sql_result["status"] == "error":
+        return f"❌ SQL Error: {sql_result['error']}"
+
+    return _safe_generate(_build_summary_prompt(question, sql_result))
+
+
+def stream_ai_summary(question: str, sql_result: dict):
+    """Stream the SQL results summary token by token."""
+    if sql_result["status"] == "error":
+        yield f"❌ SQL Error: {sql_result['error']}"
+        return
+
+    yield from _safe_generate_stream(_build_summary_prompt(question, sql_result))
 
 
 def cleanup_session(session_id: str):
@@ -284,22 +343,28 @@ def retrieve_relevant_chunks(query: str, chunks: list[str], top_k: int = 5) -> l
     return [chunk for chunk, score in scored[:top_k]]
 
 
-def answer_pdf_question(question: str, pdf_text: str) -> str:
+def retrieve_pdf_context(question: str, pdf_text: str, top_k: int = 5) -> dict:
     """
-    RAG pipeline: chunk the PDF text, find relevant sections,
-    and use Sarvam AI to generate an answer.
+    Retrieval step of the RAG pipeline: chunk the PDF text and pick the
+    most relevant sections. Returns the joined context plus metadata
+    (chunk counts and cited pages) for the caller to report.
     """
-    # Chunk the document
     chunks = chunk_text(pdf_text)
+    relevant_chunks = retrieve_relevant_chunks(question, chunks, top_k=top_k) if chunks else []
+    context = "\n\n---\n\n".join(relevant_chunks)
+    pages = sorted({int(p) for p in re.findall(r'\[Page (\d+)\]', context)})
 
-    if not chunks:
-        return "❌ Could not extract any text from the PDF document."
+    return {
+        "context": context,
+        "total_chunks": len(chunks),
+        "retrieved_chunks": len(relevant_chunks),
+        "pages": pages,
+    }
 
-    # Retrieve relevant chunks
-    relevant_chunks = retrieve_relevant_chunks(question, chunks, top_k=5)
-    context = "\n\n---\n\n".join(relevant_chunks)
 
-    prompt = f"""You are an expert document analyst. Answer the user's question based ONLY on the
+def _build_pdf_answer_prompt(question: str, context: str) -> str:
+    """Build the RAG answer prompt from the retrieved document context."""
+    return f"""You are an expert document analyst. Answer the user's question based ONLY on the
 provided document context. If the answer is not found in the context, say so clearly.
 
 DOCUMENT CONTEXT:
@@ -317,11 +382,31 @@ INSTRUCTIONS:
 
 ANSWER:"""
 
-    return _safe_generate(prompt)
 
+def answer_pdf_question(question: str, pdf_text: str) -> str:
+    """
+    RAG pipeline: chunk the PDF text, find relevant sections,
+    and use Sarvam AI to generate an answer.
+    """
+    retrieval = retrieve_pdf_context(question, pdf_text)
 
-def summarize_pdf(pdf_text: str) -> str:
-    """Generate a comprehensive summary of the entire PDF document."""
+    if not retrieval["total_chunks"]:
+        return "❌ Could not extract any text from the PDF document."
+
+    return _safe_generate(_build_pdf_answer_prompt(question, retrieval["context"]))
+
+
+def stream_pdf_answer(question: str, retrieval: dict):
+    """Stream the RAG answer for context already fetched by retrieve_pdf_context."""
+    if not retrieval["total_chunks"]:
+        yield "❌ Could not extract any text from the PDF document."
+        return
+
+    yield from _safe_generate_stream(_build_pdf_answer_prompt(question, retrieval["context"]))
+
+
+def _build_pdf_summary_prompt(pdf_text: str) -> str:
+    """Build the whole-document summary prompt."""
     # If text is very long, use chunks and summarize progressively
     if len(pdf_text) > 30000:
         chunks = chunk_text(pdf_text, chunk_size=5000, overlap=500)
@@ -343,7 +428,17 @@ Please provide:
 
 Format your response in clear markdown."""
 
-    return _safe_generate(prompt)
+    return prompt
+
+
+def summarize_pdf(pdf_text: str) -> str:
+    """Generate a comprehensive summary of the entire PDF document."""
+    return _safe_generate(_build_pdf_summary_prompt(pdf_text))
+
+
+def stream_pdf_summary(pdf_text: str):
+    """Stream the whole-document summary token by token."""
+    yield from _safe_generate_stream(_build_pdf_summary_prompt(pdf_text))
 
 
 # ══════════════════════════════════════════════════════════════════════════════
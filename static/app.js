@@ -558,27 +558,34 @@ async function sendSQLQuery(question) {
   addChatMsg("sql", "user", question);
   showLoading("AI is analyzing your data…");
 
+  // SQL + results arrive first; the summary streams in underneath
+  let msg = null, resultsHTML = "", summary = "";
+  const render = () => {
+    if (!msg) { msg = addChatMsg("sql", "ai", "", true); hideLoading(); }
+    setChatMsgContent(msg, resultsHTML + (summary ? `<div style="margin-top:10px;line-height:1.7;">${formatMarkdown(summary)}</div>` : ""));
+  };
+
   try {
-    const res = await fetch(`${API_BASE}/sql/query`, {
+    await streamSSE(`${API_BASE}/sql/query/stream`, {
       method: "POST",
       headers: { "Content-Type": "application/json" },
       body: JSON.stringify({ session_id: state.sessionId, question }),
+    }, {
+      sql(data) {
+        if (data.sql_query) resultsHTML += `<div class="sql-block">${escapeHTML(data.sql_query)}</div>`;
+        if (data.results?.length) {
+          const cols = data.columns?.length ? data.columns : Object.keys(data.results[0]);
+          resultsHTML += `<div class="data-table-wrap" style="max-height:250px;overflow:auto;">${buildHTMLTable(cols, data.results.slice(0, 50))}</div>`;
+        }
+        render();
+      },
+      token(data) { summary += data.text; render(); },
+      done() { state.queryCount++; },
+      error(data) {
+        if (!msg) hideLoading();
+        addChatMsg("sql", "ai", `Error: ${data.detail || "Error processing query"}`);
+      },
     });
-    const data = await res.json();
-
-    if (res.ok) {
-      let aiHTML = "";
-      if (data.sql_query) aiHTML += `<div class="sql-block">${escapeHTML(data.sql_query)}</div>`;
-      if (data.results?.length) {
-        const cols = data.columns || Object.keys(data.results[0]);
-        aiHTML += `<div class="data-table-wrap" style="max-height:250px;overflow:auto;">${buildHTMLTable(cols, data.results.slice(0, 50))}</div>`;
-      }
-      if (data.ai_summary) aiHTML += `<div style="margin-top:10px;line-height:1.7;">${formatMarkdown(data.ai_summary)}</div>`;
-      addChatMsg("sql", "ai", aiHTML, true);
-      state.queryCount++;
-    } else {
-      addChatMsg("sql", "ai", `Error: ${data.detail || "Error processing query"}`);
-    }
   } catch (err) {
     addChatMsg("sql", "ai", `Network error: ${err.message}`);
   }
@@ -637,14 +644,8 @@ async function generatePDFSummary() {
   try {
     const formData = new FormData();
     formData.append("session_id", state.sessionId);
-    const res = await fetch(`${API_BASE}/pdf/summarize`, { method: "POST", body: formData });
-    const data = await res.json();
-    if (res.ok) {
-      addChatMsg("pdf", "ai", formatMarkdown(data.summary), true);
-      state.queryCount++;
-    } else {
-      toast(data.detail || "Error", "error");
-    }
+    await streamPDFAnswer(`${API_BASE}/pdf/summarize/stream`, { method: "POST", body: formData },
+      detail => toast(detail || "Error", "error"));
   } catch (err) { toast("Error: " + err.message, "error"); }
   hideLoading();
 }
@@ -655,24 +656,31 @@ async function sendPDFQuery(question) {
   showLoading("Analyzing your PDF…");
 
   try {
-    const res = await fetch(`${API_BASE}/pdf/query`, {
+    await streamPDFAnswer(`${API_BASE}/pdf/query/stream`, {
       method: "POST",
       headers: { "Content-Type": "application/json" },
       body: JSON.stringify({ session_id: state.sessionId, question }),
-    });
-    const data = await res.json();
-    if (res.ok) {
-      addChatMsg("pdf", "ai", formatMarkdown(data.answer), true);
-      state.queryCount++;
-    } else {
-      addChatMsg("pdf", "ai", `Error: ${data.detail || "Error"}`);
-    }
+    }, detail => addChatMsg("pdf", "ai", `Error: ${detail || "Error"}`));
   } catch (err) {
     addChatMsg("pdf", "ai", `Error: ${err.message}`);
   }
   hideLoading();
 }
 
+// Render a streamed PDF answer/summary into a single chat message as tokens arrive
+async function streamPDFAnswer(url, options, onError) {
+  let msg = null, text = "";
+  await streamSSE(url, options, {
+    token(data) {
+      text += data.text;
+      if (!msg) { msg = addChatMsg("pdf", "ai", "", true); hideLoading(); }
+      setChatMsgContent(msg, formatMarkdown(text));
+    },
+    done() { state.queryCount++; },
+    error(data) { hideLoading(); onError(data.detail); },
+  });
+}
+
 function sendPDFQueryFromInput() {
   const input = document.getElementById("pdf-chat-input");
   const q = input.value.trim();
@@ -699,6 +707,45 @@ function addChatMsg(type, role, content, isHTML = false) {
   div.innerHTML = label + (isHTML ? content : escapeHTML(content));
   container.appendChild(div);
   container.scrollTop = container.scrollHeight;
+  return div;
+}
+
+// Replace the body of an AI chat message (keeps the label), used while streaming
+function setChatMsgContent(div, html) {
+  div.innerHTML = `<div class="chat-msg-ai-label">Sarvam AI</div>` + html;
+  div.parentElement.scrollTop = div.parentElement.scrollHeight;
+}
+
+// POST to a Server-Sent Events endpoint and dispatch each event to handlers[event](data).
+// Non-2xx responses (e.g. "no data loaded") are JSON and go to handlers.error.
+async function streamSSE(url, options, handlers) {
+  const res = await fetch(url, options);
+  if (!res.ok) {
+    const data = await res.json().catch(() => ({}));
+    handlers.error?.(data);
+    return;
+  }
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let sep;
+    while ((sep = buffer.indexOf("\n\n")) !== -1) {
+      const frame = buffer.slice(0, sep);
+      buffer = buffer.slice(sep + 2);
+      let event = "message", data = "";
+      for (const line of frame.split("\n")) {
+        if (line.startsWith("event:")) event = line.slice(6).trim();
+        else if (line.startsWith("data:")) data += line.slice(5).trim();
+      }
+      if (data) handlers[event]?.(JSON.parse(data));
+    }
+  }
 }
 
 function escapeHTML(str) {